@@ -32,16 +32,25 @@ setup(
             "langchain-community>=0.3.0,<1.0.0",
             "nbformat>=5.9.0",
             "nbconvert>=7.14.0",
+            "orjson>=3.9.0",
             "python-docx>=1.1.0",
             "reportlab>=4.0.0",
-            "faiss-cpu>=1.7.4",
+            "faiss-cpu>=1.8.0",
+            "simsimd>=5.0.0",
             "chromadb>=0.4.0",
-            "sentence-transformers>=2.2.0",
+            "sentence-transformers>=3.2.0",
+            "tiktoken>=0.5.0",
             "aiohttp>=3.9.0",
             "beautifulsoup4>=4.12.0",
             "fastapi>=0.115.0",
             "uvicorn>=0.30.0",
         ],
+        "local-embeddings": [
+            "sentence-transformers>=3.2.0",
+            "langchain-huggingface>=0.1.0",
+            "optimum[onnxruntime]>=1.23.0",
+            "optimum[openvino]>=1.23.0",
+        ],
         "dev": [
             "black>=23.0.0",
             "ruff>=0.1.0",
@@ -49,6 +58,7 @@ setup(
             "pytest>=7.4.0",
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "httpx>=0.28.0",
         ],
     },
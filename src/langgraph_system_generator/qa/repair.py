@@ -7,10 +7,15 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 import nbformat
+import orjson
 from nbformat import NotebookNode
 
 from langgraph_system_generator.generator.state import QAReport
-from langgraph_system_generator.qa.validators import NotebookValidator
+from langgraph_system_generator.qa.validators import NotebookValidator, read_notebook
+
+_MISSING_IMPORTS_RE = re.compile(r"Missing required imports: (.+)")
+_MISSING_SECTIONS_RE = re.compile(r"Missing required sections: (.+)")
+_LANGGRAPH_GRAPH_IMPORT_RE = re.compile(r"^(\s*from\s+langgraph\.graph\s+import\s+)(.+)$")
 
 
 class NotebookRepairAgent:
@@ -54,8 +59,7 @@ class NotebookRepairAgent:
 
         path = Path(notebook_path)
         try:
-            with path.open("r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
+            nb = read_notebook(path)
         except Exception:
             # Can't repair if we can't read the notebook
             return False, qa_reports
@@ -75,17 +79,28 @@ class NotebookRepairAgent:
         if repaired:
             # Save the repaired notebook
             try:
-                with path.open("w", encoding="utf-8") as f:
-                    nbformat.write(nb, f)
+                self._write_notebook(nb, path)
             except Exception:
                 return False, qa_reports
 
-            # Re-validate
+            # Re-validate (includes nbformat schema validation)
             new_reports = self.validator.validate_all(notebook_path)
             return all(r.passed for r in new_reports), new_reports
 
         return False, qa_reports
 
+    @staticmethod
+    def _write_notebook(nb: NotebookNode, path: Path) -> None:
+        """Serialize a notebook with orjson; validation happens on re-check.
+
+        Args:
+            nb: Notebook to write
+            path: Destination path
+        """
+        path.write_bytes(
+            orjson.dumps(nb, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+
     def _repair_placeholders(self, nb: NotebookNode) -> bool:
         """Remove or replace placeholder text in cells.
 
@@ -148,7 +163,7 @@ class NotebookRepairAgent:
             True if any repairs were made
         """
         # Extract missing imports from the report message
-        match = re.search(r"Missing required imports: (.+)", report.message)
+        match = _MISSING_IMPORTS_RE.search(report.message)
         if not match:
             return False
 
@@ -181,7 +196,7 @@ class NotebookRepairAgent:
 
         # Try to consolidate into existing 'from langgraph.graph import ...' imports
         for i, line in enumerate(lines):
-            match_import = re.match(r"^(\s*from\s+langgraph\.graph\s+import\s+)(.+)$", line)
+            match_import = _LANGGRAPH_GRAPH_IMPORT_RE.match(line)
             if not match_import:
                 continue
 
@@ -241,7 +256,7 @@ class NotebookRepairAgent:
             True if any repairs were made
         """
         # Extract missing sections from the report message
-        match = re.search(r"Missing required sections: (.+)", report.message)
+        match = _MISSING_SECTIONS_RE.search(report.message)
         if not match:
             return False
 
@@ -5,12 +5,75 @@ from __future__ import annotations
 import json
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import nbformat
+import orjson
+from nbformat import NotebookNode
+from nbformat.reader import get_version
 
 from langgraph_system_generator.generator.state import QAReport
 
+# A notebook file path, an open notebook file, or an already-parsed notebook.
+NotebookSource = Union[str, Path, IO[Any], NotebookNode]
+
+# Lines consisting only of an ellipsis placeholder.
+_ELLIPSIS_LINE_RE = re.compile(r"(?m)^\s*\.\.\.\s*$")
+
+
+def read_notebook(notebook_path: NotebookSource) -> NotebookNode:
+    """Parse a notebook source as nbformat v4.
+
+    Parsed notebooks are returned as-is; open files are read from their
+    current position. JSON is decoded with orjson and, unlike
+    ``nbformat.read``, not schema-validated here: callers that need
+    validation run ``nbformat.validate`` on the result.
+
+    Args:
+        notebook_path: Notebook file path, open file, or parsed notebook
+
+    Returns:
+        The notebook converted to nbformat v4 with joined cell sources
+    """
+    if isinstance(notebook_path, NotebookNode):
+        return notebook_path
+    if isinstance(notebook_path, (str, Path)):
+        raw = Path(notebook_path).read_bytes()
+    else:
+        raw = notebook_path.read()
+
+    nb_dict = orjson.loads(raw)
+    major, minor = get_version(nb_dict)
+    if major not in nbformat.versions:
+        raise nbformat.NBFormatError(f"Unsupported nbformat version {major}")
+    try:
+        nb = nbformat.versions[major].to_notebook_json(nb_dict, minor=minor)
+    except AttributeError as e:
+        raise nbformat.ValidationError(
+            f"The notebook is invalid and is missing an expected key: {e}"
+        ) from None
+    return nbformat.convert(nb, 4)
+
+
+class _NotebookContent(NamedTuple):
+    """Cell data gathered in one pass over a notebook, shared by the checks."""
+
+    sections: Set[str]
+    source: str
+    code_cells: List[NotebookNode]
+    code_source: str
+
 
 class NotebookValidator:
     """Validates generated notebooks for quality and correctness."""
@@ -37,331 +100,424 @@ class NotebookValidator:
         "END",
     ]
 
-    def validate_json_structure(self, notebook_path: str | Path) -> QAReport:
+    # Error message prefix and suggestions reported when a check raises.
+    CHECK_ERRORS: Dict[str, Tuple[str, List[str]]] = {
+        "No Placeholders": (
+            "Error checking placeholders",
+            ["Verify notebook file is readable"],
+        ),
+        "Required Sections": (
+            "Error checking sections",
+            ["Verify notebook structure and metadata"],
+        ),
+        "Required Imports": (
+            "Error checking imports",
+            ["Verify notebook can be read and parsed"],
+        ),
+        "Graph Compilation": (
+            "Error checking graph compilation",
+            ["Verify notebook structure and code cells"],
+        ),
+    }
+
+    def validate_json_structure(self, notebook_path: NotebookSource) -> QAReport:
         """Check that notebook JSON is valid and can be loaded.
 
         Args:
-            notebook_path: Path to the notebook file
+            notebook_path: Notebook file path, open file, or parsed notebook
 
         Returns:
             QAReport with validation results
         """
+        report, _ = self._load_validated(notebook_path)
+        return report
+
+    def _load_validated(
+        self, notebook_path: NotebookSource
+    ) -> Tuple[QAReport, Optional[NotebookNode]]:
+        """Read, parse and schema-validate a notebook in a single pass.
+
+        Returns:
+            The JSON Validity report and the parsed notebook, or ``None`` in
+            place of the notebook when validation failed
+        """
         try:
-            path = Path(notebook_path)
-            if not path.exists():
-                return QAReport(
-                    check_name="JSON Validity",
-                    passed=False,
-                    message=f"Notebook file not found: {notebook_path}",
-                    suggestions=["Ensure the notebook was generated and saved correctly"],
+            is_path = isinstance(notebook_path, (str, Path))
+            if is_path and not Path(notebook_path).exists():
+                return (
+                    QAReport(
+                        check_name="JSON Validity",
+                        passed=False,
+                        message=f"Notebook file not found: {notebook_path}",
+                        suggestions=["Ensure the notebook was generated and saved correctly"],
+                    ),
+                    None,
                 )
 
-            with path.open("r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
+            nb = read_notebook(notebook_path)
 
             # Validate the notebook structure
             nbformat.validate(nb)
 
-            return QAReport(
-                check_name="JSON Validity",
-                passed=True,
-                message="Notebook JSON is valid and properly structured",
+            return (
+                QAReport(
+                    check_name="JSON Validity",
+                    passed=True,
+                    message="Notebook JSON is valid and properly structured",
+                ),
+                nb,
             )
         except json.JSONDecodeError as e:
-            return QAReport(
-                check_name="JSON Validity",
-                passed=False,
-                message=f"Invalid JSON: {str(e)}",
-                suggestions=[
-                    "Check for syntax errors in the notebook JSON",
-                    "Ensure the file is properly encoded as UTF-8",
-                ],
+            return (
+                QAReport(
+                    check_name="JSON Validity",
+                    passed=False,
+                    message=f"Invalid JSON: {str(e)}",
+                    suggestions=[
+                        "Check for syntax errors in the notebook JSON",
+                        "Ensure the file is properly encoded as UTF-8",
+                    ],
+                ),
+                None,
             )
         except nbformat.ValidationError as e:
-            return QAReport(
-                check_name="JSON Validity",
-                passed=False,
-                message=f"Invalid notebook structure: {str(e)}",
-                suggestions=[
-                    "Verify all required notebook fields are present",
-                    "Check cell structure and metadata",
-                ],
+            return (
+                QAReport(
+                    check_name="JSON Validity",
+                    passed=False,
+                    message=f"Invalid notebook structure: {str(e)}",
+                    suggestions=[
+                        "Verify all required notebook fields are present",
+                        "Check cell structure and metadata",
+                    ],
+                ),
+                None,
             )
         except Exception as e:
-            return QAReport(
-                check_name="JSON Validity",
-                passed=False,
-                message=f"Error reading notebook: {str(e)}",
-                suggestions=["Check file permissions and path"],
+            return (
+                QAReport(
+                    check_name="JSON Validity",
+                    passed=False,
+                    message=f"Error reading notebook: {str(e)}",
+                    suggestions=["Check file permissions and path"],
+                ),
+                None,
             )
 
-    def check_no_placeholders(self, notebook_path: str | Path) -> QAReport:
+    def check_no_placeholders(self, notebook_path: NotebookSource) -> QAReport:
         """Ensure no placeholder text remains in the notebook.
 
         Args:
-            notebook_path: Path to the notebook file
+            notebook_path: Notebook file path, open file, or parsed notebook
 
         Returns:
             QAReport with validation results
         """
-        try:
-            path = Path(notebook_path)
-            with path.open("r", encoding="utf-8") as f:
-                content = f.read()
-
-            found_placeholders = []
-            for pattern in self.PLACEHOLDER_PATTERNS:
-                # Special-case "..." to only match standalone ellipsis lines,
-                # to avoid false positives in string literals or comments.
-                if pattern == "...":
-                    matches = re.findall(r"(?m)^\s*\.\.\.\s*$", content)
-                    count = len(matches)
-                    if count > 0:
-                        found_placeholders.append(f"{pattern} ({count}x)")
-                else:
-                    if pattern in content:
-                        # Count occurrences
-                        count = content.count(pattern)
-                        found_placeholders.append(f"{pattern} ({count}x)")
-
-            if found_placeholders:
-                return QAReport(
-                    check_name="No Placeholders",
-                    passed=False,
-                    message=f"Found placeholders: {', '.join(found_placeholders)}",
-                    suggestions=[
-                        "Replace all TODO/FIXME markers with actual implementation",
-                        "Remove ellipsis (...) placeholders",
-                        "Complete all code sections marked for implementation",
-                    ],
-                )
-
-            return QAReport(
-                check_name="No Placeholders",
-                passed=True,
-                message="No placeholders found in notebook",
-            )
-        except Exception as e:
-            return QAReport(
-                check_name="No Placeholders",
-                passed=False,
-                message=f"Error checking placeholders: {str(e)}",
-                suggestions=["Verify notebook file is readable"],
-            )
+        return self._run_check(
+            "No Placeholders",
+            lambda: self._check_no_placeholders(self._collect_content(notebook_path)),
+        )
 
     def check_required_sections(
-        self, notebook_path: str | Path, required_sections: Optional[List[str]] = None
+        self,
+        notebook_path: NotebookSource,
+        required_sections: Optional[List[str]] = None,
     ) -> QAReport:
         """Verify that notebook has all required sections.
 
         Args:
-            notebook_path: Path to the notebook file
+            notebook_path: Notebook file path, open file, or parsed notebook
             required_sections: Optional list of required section names.
                               Uses default if not provided.
 
         Returns:
             QAReport with validation results
         """
-        try:
-            path = Path(notebook_path)
-            with path.open("r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
-
-            sections_to_check = required_sections or self.REQUIRED_SECTIONS
-            present_sections = set()
-
-            for cell in nb.cells:
-                section = cell.metadata.get("section")
-                if section:
-                    present_sections.add(section)
-
-            missing_sections = set(sections_to_check) - present_sections
-
-            if missing_sections:
-                return QAReport(
-                    check_name="Required Sections",
-                    passed=False,
-                    message=f"Missing required sections: {', '.join(sorted(missing_sections))}",
-                    suggestions=[
-                        f"Add cells with section metadata for: {', '.join(sorted(missing_sections))}",
-                        "Ensure minimum required sections are present",
-                    ],
-                )
-
-            return QAReport(
-                check_name="Required Sections",
-                passed=True,
-                message=f"All required sections present: {', '.join(sorted(present_sections))}",
-            )
-        except Exception as e:
-            return QAReport(
-                check_name="Required Sections",
-                passed=False,
-                message=f"Error checking sections: {str(e)}",
-                suggestions=["Verify notebook structure and metadata"],
-            )
+        return self._run_check(
+            "Required Sections",
+            lambda: self._check_required_sections(
+                self._collect_content(notebook_path), required_sections
+            ),
+        )
 
     def check_imports_present(
-        self, notebook_path: str | Path, required_imports: Optional[List[str]] = None
+        self,
+        notebook_path: NotebookSource,
+        required_imports: Optional[List[str]] = None,
     ) -> QAReport:
         """Ensure necessary imports are present in the notebook.
 
         Args:
-            notebook_path: Path to the notebook file
+            notebook_path: Notebook file path, open file, or parsed notebook
             required_imports: Optional list of required import names.
                             Uses default if not provided.
 
         Returns:
             QAReport with validation results
         """
-        try:
-            path = Path(notebook_path)
-            with path.open("r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
-
-            imports_to_check = required_imports or self.REQUIRED_IMPORTS
-            
-            # Collect all code content
-            code_content = ""
-            for cell in nb.cells:
-                if cell.cell_type == "code":
-                    code_content += cell.source + "\n"
-
-            missing_imports = []
-            for imp in imports_to_check:
-                if imp not in code_content:
-                    missing_imports.append(imp)
-
-            if missing_imports:
-                return QAReport(
-                    check_name="Required Imports",
-                    passed=False,
-                    message=f"Missing required imports: {', '.join(missing_imports)}",
-                    suggestions=[
-                        f"Add import statements for: {', '.join(missing_imports)}",
-                        "Ensure all LangGraph dependencies are imported",
-                        "Check setup/installation cells for missing imports",
-                    ],
-                )
-
-            return QAReport(
-                check_name="Required Imports",
-                passed=True,
-                message="All required imports are present",
-            )
-        except Exception as e:
-            return QAReport(
-                check_name="Required Imports",
-                passed=False,
-                message=f"Error checking imports: {str(e)}",
-                suggestions=["Verify notebook can be read and parsed"],
-            )
-
-    def check_graph_compiles(self, notebook_path: str | Path) -> QAReport:
+        return self._run_check(
+            "Required Imports",
+            lambda: self._check_imports_present(
+                self._collect_content(notebook_path), required_imports
+            ),
+        )
+
+    def check_graph_compiles(self, notebook_path: NotebookSource) -> QAReport:
         """Check if the graph construction code compiles (syntax check).
 
         Note: This performs static syntax validation, not full execution.
         For full execution testing, use runtime validation tools.
 
         Args:
-            notebook_path: Path to the notebook file
+            notebook_path: Notebook file path, open file, or parsed notebook
 
         Returns:
             QAReport with validation results
         """
+        return self._run_check(
+            "Graph Compilation",
+            lambda: self._check_graph_compiles(self._collect_content(notebook_path)),
+        )
+
+    def validate_all(self, notebook_path: NotebookSource) -> List[QAReport]:
+        """Run all validation checks on a notebook.
+
+        The notebook is read and parsed once, and its cell sources are
+        gathered once; every check runs against the same gathered content.
+
+        Args:
+            notebook_path: Notebook file path, open file, or parsed notebook
+
+        Returns:
+            List of QAReport objects, one for each validation check
+        """
+        # JSON structure is prerequisite for other checks
+        json_report, nb = self._load_validated(notebook_path)
+        reports = [json_report]
+
+        if nb is None:
+            # If JSON is invalid, skip other checks
+            return reports
+
+        # Run remaining checks
+        content = self._collect_content(nb)
+        reports.append(
+            self._run_check(
+                "No Placeholders", lambda: self._check_no_placeholders(content)
+            )
+        )
+        reports.append(
+            self._run_check(
+                "Required Sections", lambda: self._check_required_sections(content)
+            )
+        )
+        reports.append(
+            self._run_check(
+                "Required Imports", lambda: self._check_imports_present(content)
+            )
+        )
+        reports.append(
+            self._run_check(
+                "Graph Compilation", lambda: self._check_graph_compiles(content)
+            )
+        )
+
+        return reports
+
+    @staticmethod
+    def _collect_content(notebook_path: NotebookSource) -> _NotebookContent:
+        """Gather section metadata and cell sources in a single pass.
+
+        Args:
+            notebook_path: Notebook file path, open file, or parsed notebook
+
+        Returns:
+            The notebook's sections, joined cell sources, and code cells
+        """
+        nb = read_notebook(notebook_path)
+        sections: Set[str] = set()
+        sources: List[str] = []
+        code_cells: List[NotebookNode] = []
+        for cell in nb.cells:
+            section = cell.metadata.get("section")
+            if section:
+                sections.add(section)
+            sources.append(cell.source)
+            if cell.cell_type == "code":
+                code_cells.append(cell)
+
+        return _NotebookContent(
+            sections=sections,
+            source="\n".join(sources),
+            code_cells=code_cells,
+            code_source="\n\n".join(cell.source for cell in code_cells),
+        )
+
+    def _run_check(self, check_name: str, check: Callable[[], QAReport]) -> QAReport:
+        """Run a check, turning any exception into a failed report.
+
+        Args:
+            check_name: Name of the check, used to look up ``CHECK_ERRORS``
+            check: Callable producing the check's report
+
+        Returns:
+            The check's report, or a failed report describing the error
+        """
         try:
-            path = Path(notebook_path)
-            with path.open("r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
-
-            # Extract code cells
-            code_cells = [cell for cell in nb.cells if cell.cell_type == "code"]
-            
-            if not code_cells:
-                return QAReport(
-                    check_name="Graph Compilation",
-                    passed=False,
-                    message="No code cells found in notebook",
-                    suggestions=["Add code cells to implement the graph"],
-                )
+            return check()
+        except Exception as e:
+            prefix, suggestions = self.CHECK_ERRORS[check_name]
+            return QAReport(
+                check_name=check_name,
+                passed=False,
+                message=f"{prefix}: {str(e)}",
+                suggestions=list(suggestions),
+            )
 
-            # Collect all code and try to compile it
-            all_code = "\n\n".join(cell.source for cell in code_cells)
-            
-            try:
-                compile(all_code, "<notebook>", "exec")
-            except SyntaxError as e:
-                return QAReport(
-                    check_name="Graph Compilation",
-                    passed=False,
-                    message=f"Syntax error in notebook code: {e.msg} at line {e.lineno}",
-                    suggestions=[
-                        "Fix syntax errors in the code cells",
-                        "Check for missing colons, parentheses, or indentation issues",
-                        "Validate Python syntax before generating notebook",
-                    ],
-                )
+    def _check_no_placeholders(self, content: _NotebookContent) -> QAReport:
+        """Scan every cell's source for placeholder text."""
+        source = content.source
+
+        found_placeholders = []
+        for pattern in self.PLACEHOLDER_PATTERNS:
+            # Special-case "..." to only match standalone ellipsis lines,
+            # to avoid false positives in string literals or comments.
+            if pattern == "...":
+                count = len(_ELLIPSIS_LINE_RE.findall(source))
+            else:
+                # Fixed tokens need no regex; str.count is a single fast scan.
+                count = source.count(pattern)
+            if count > 0:
+                found_placeholders.append(f"{pattern} ({count}x)")
+
+        if found_placeholders:
+            return QAReport(
+                check_name="No Placeholders",
+                passed=False,
+                message=f"Found placeholders: {', '.join(found_placeholders)}",
+                suggestions=[
+                    "Replace all TODO/FIXME markers with actual implementation",
+                    "Remove ellipsis (...) placeholders",
+                    "Complete all code sections marked for implementation",
+                ],
+            )
 
-            # Check for basic graph construction patterns
-            if "StateGraph" not in all_code:
-                return QAReport(
-                    check_name="Graph Compilation",
-                    passed=False,
-                    message="No StateGraph construction found in notebook",
-                    suggestions=[
-                        "Add StateGraph construction code",
-                        "Ensure LangGraph is properly used",
-                    ],
-                )
+        return QAReport(
+            check_name="No Placeholders",
+            passed=True,
+            message="No placeholders found in notebook",
+        )
 
-            if ".compile()" not in all_code:
-                return QAReport(
-                    check_name="Graph Compilation",
-                    passed=False,
-                    message="Graph compilation step (.compile()) not found",
-                    suggestions=[
-                        "Add graph.compile() call to compile the workflow",
-                        "Ensure the graph is compiled before execution",
-                    ],
-                )
+    def _check_required_sections(
+        self, content: _NotebookContent, required_sections: Optional[List[str]] = None
+    ) -> QAReport:
+        """Compare section metadata on the notebook's cells to the required set."""
+        sections_to_check = required_sections or self.REQUIRED_SECTIONS
+        present_sections = content.sections
 
+        missing_sections = set(sections_to_check) - present_sections
+
+        if missing_sections:
             return QAReport(
-                check_name="Graph Compilation",
-                passed=True,
-                message="Notebook code compiles and contains proper graph construction",
+                check_name="Required Sections",
+                passed=False,
+                message=f"Missing required sections: {', '.join(sorted(missing_sections))}",
+                suggestions=[
+                    f"Add cells with section metadata for: {', '.join(sorted(missing_sections))}",
+                    "Ensure minimum required sections are present",
+                ],
             )
-        except Exception as e:
+
+        return QAReport(
+            check_name="Required Sections",
+            passed=True,
+            message=f"All required sections present: {', '.join(sorted(present_sections))}",
+        )
+
+    def _check_imports_present(
+        self, content: _NotebookContent, required_imports: Optional[List[str]] = None
+    ) -> QAReport:
+        """Look for the required import names in the notebook's code cells."""
+        imports_to_check = required_imports or self.REQUIRED_IMPORTS
+
+        if content.code_cells:
+            missing_imports = [
+                imp for imp in imports_to_check if imp not in content.code_source
+            ]
+        else:
+            # Nothing to search without code cells
+            missing_imports = list(imports_to_check)
+
+        if missing_imports:
+            return QAReport(
+                check_name="Required Imports",
+                passed=False,
+                message=f"Missing required imports: {', '.join(missing_imports)}",
+                suggestions=[
+                    f"Add import statements for: {', '.join(missing_imports)}",
+                    "Ensure all LangGraph dependencies are imported",
+                    "Check setup/installation cells for missing imports",
+                ],
+            )
+
+        return QAReport(
+            check_name="Required Imports",
+            passed=True,
+            message="All required imports are present",
+        )
+
+    def _check_graph_compiles(self, content: _NotebookContent) -> QAReport:
+        """Syntax-check the notebook's code cells and look for graph construction."""
+        if not content.code_cells:
             return QAReport(
                 check_name="Graph Compilation",
                 passed=False,
-                message=f"Error checking graph compilation: {str(e)}",
-                suggestions=["Verify notebook structure and code cells"],
+                message="No code cells found in notebook",
+                suggestions=["Add code cells to implement the graph"],
             )
 
-    def validate_all(self, notebook_path: str | Path) -> List[QAReport]:
-        """Run all validation checks on a notebook.
+        # Try to compile all code cells as one module
+        all_code = content.code_source
 
-        Args:
-            notebook_path: Path to the notebook file
+        try:
+            compile(all_code, "<notebook>", "exec")
+        except SyntaxError as e:
+            return QAReport(
+                check_name="Graph Compilation",
+                passed=False,
+                message=f"Syntax error in notebook code: {e.msg} at line {e.lineno}",
+                suggestions=[
+                    "Fix syntax errors in the code cells",
+                    "Check for missing colons, parentheses, or indentation issues",
+                    "Validate Python syntax before generating notebook",
+                ],
+            )
 
-        Returns:
-            List of QAReport objects, one for each validation check
-        """
-        reports = []
-        
-        # JSON structure is prerequisite for other checks
-        json_report = self.validate_json_structure(notebook_path)
-        reports.append(json_report)
-        
-        if not json_report.passed:
-            # If JSON is invalid, skip other checks
-            return reports
+        # Check for basic graph construction patterns
+        if "StateGraph" not in all_code:
+            return QAReport(
+                check_name="Graph Compilation",
+                passed=False,
+                message="No StateGraph construction found in notebook",
+                suggestions=[
+                    "Add StateGraph construction code",
+                    "Ensure LangGraph is properly used",
+                ],
+            )
 
-        # Run remaining checks
-        reports.append(self.check_no_placeholders(notebook_path))
-        reports.append(self.check_required_sections(notebook_path))
-        reports.append(self.check_imports_present(notebook_path))
-        reports.append(self.check_graph_compiles(notebook_path))
-        
-        return reports
+        if ".compile()" not in all_code:
+            return QAReport(
+                check_name="Graph Compilation",
+                passed=False,
+                message="Graph compilation step (.compile()) not found",
+                suggestions=[
+                    "Add graph.compile() call to compile the workflow",
+                    "Ensure the graph is compiled before execution",
+                ],
+            )
 
+        return QAReport(
+            check_name="Graph Compilation",
+            passed=True,
+            message="Notebook code compiles and contains proper graph construction",
+        )
@@ -1,7 +1,10 @@
 """RAG system for LangGraph documentation retrieval."""
 
 from langgraph_system_generator.rag.cache import DocumentCache
-from langgraph_system_generator.rag.embeddings import VectorStoreManager
+from langgraph_system_generator.rag.embeddings import (
+    VectorStoreManager,
+    create_local_embeddings,
+)
 from langgraph_system_generator.rag.indexer import (
     DocsIndexer,
     build_docs_index,
@@ -17,4 +20,5 @@ __all__ = [
     "VectorStoreManager",
     "build_docs_index",
     "build_index_from_cache",
+    "create_local_embeddings",
 ]
\ No newline at end of file
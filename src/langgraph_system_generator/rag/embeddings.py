@@ -5,20 +5,119 @@ from __future__ import annotations
 import hashlib
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
+from langgraph_system_generator.utils.config import get_settings
+
+EmbeddingBackend = Literal["torch", "onnx", "openvino"]
+
+DEFAULT_LOCAL_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Pre-quantized int8 graphs published alongside sentence-transformers models.
+QUANTIZED_MODEL_FILES: Dict[str, str] = {
+    "onnx": "onnx/model_qint8_avx512_vnni.onnx",
+    "openvino": "openvino/openvino_model_qint8_quantized.xml",
+}
+
+
+def create_local_embeddings(
+    model_name: str = DEFAULT_LOCAL_EMBEDDING_MODEL,
+    *,
+    backend: EmbeddingBackend = "onnx",
+    model_file: Optional[str] = None,
+    batch_size: int = 64,
+) -> Embeddings:
+    """Create a local sentence-transformers embedding model.
+
+    Requires the ``local-embeddings`` extra, which installs
+    sentence-transformers, langchain-huggingface and the optimum runtimes
+    for the ``"onnx"`` and ``"openvino"`` backends.
+
+    Parameters
+    ----------
+    model_name
+        Hugging Face model identifier or local path.
+    backend
+        Inference engine used by sentence-transformers. ``"onnx"`` and
+        ``"openvino"`` load the int8-quantized graph from
+        ``QUANTIZED_MODEL_FILES`` unless ``model_file`` overrides it.
+    model_file
+        Optional graph file inside the model repository. Pass an empty string
+        to let sentence-transformers export an fp32 graph on first use for
+        models that do not publish a quantized one.
+    batch_size
+        Number of texts encoded per forward pass.
+
+    Returns
+    -------
+    Embeddings
+        LangChain-compatible embeddings returning L2-normalized vectors.
+    """
+
+    try:
+        import sentence_transformers  # noqa: F401
+        from langchain_huggingface import HuggingFaceEmbeddings
+    except ImportError as exc:
+        raise ImportError(
+            "sentence-transformers and langchain-huggingface are required for "
+            "local embeddings. Install them with: "
+            'pip install "langgraph-system-generator[local-embeddings]"'
+        ) from exc
+
+    model_kwargs: Dict[str, object] = {}
+    if backend != "torch":
+        model_kwargs["backend"] = backend
+        file_name = QUANTIZED_MODEL_FILES[backend] if model_file is None else model_file
+        if file_name:
+            model_kwargs["model_kwargs"] = {"file_name": file_name}
+
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs=model_kwargs,
+        encode_kwargs={"batch_size": batch_size, "normalize_embeddings": True},
+    )
+
 
 class VectorStoreManager:
     """Manages creation and loading of the documentation vector index."""
 
-    def __init__(self, store_path: str, embeddings: Optional[Embeddings] = None):
+    # FAISS factory strings used when building a new index. Small corpora use
+    # an HNSW graph (optionally over 8-bit scalar-quantized codes); large ones
+    # switch to IVF with 4-bit FastScan PQ codes, which FAISS evaluates with
+    # its SIMD (AVX2/AVX-512/NEON) kernels.
+    HNSW_INDEX_FACTORY = "HNSW32"
+    HNSW_INT8_INDEX_FACTORY = "HNSW32,SQ8"
+    IVFPQ_INDEX_FACTORY = "IVF256,PQ32x4fs"
+    IVFPQ_SUBQUANTIZERS = 32
+    IVFPQ_MIN_DOCUMENTS = 5000
+    IVFPQ_NPROBE = 16
+
+    def __init__(
+        self,
+        store_path: str,
+        embeddings: Optional[Embeddings] = None,
+        *,
+        int8_quantize: Optional[bool] = None,
+        embed_batch_size: Optional[int] = None,
+    ):
+        if embed_batch_size is not None and embed_batch_size <= 0:
+            raise ValueError(
+                f"embed_batch_size ({embed_batch_size}) must be a positive integer."
+            )
         self.store_path = str(store_path)
         self.embeddings = embeddings or OpenAIEmbeddings()
+        self.int8_quantize = (
+            get_settings().vector_store_int8 if int8_quantize is None else int8_quantize
+        )
+        self.embed_batch_size = embed_batch_size
         self.vector_store: Optional[FAISS] = None
 
     def index_exists(self) -> bool:
@@ -50,7 +149,19 @@ class VectorStoreManager:
             raise ValueError("No documents provided for indexing.")
 
         Path(self.store_path).mkdir(parents=True, exist_ok=True)
-        self.vector_store = FAISS.from_documents(documents, self.embeddings)
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+        vectors = self._embed_texts(texts)
+
+        index = self._build_faiss_index(vectors)
+        self.vector_store = FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={},
+            normalize_L2=True,
+        )
+        self.vector_store.add_embeddings(zip(texts, vectors), metadatas=metadatas)
         self.vector_store.save_local(self.store_path)
         self._write_integrity_manifest()
         return self.vector_store
@@ -79,6 +190,7 @@ class VectorStoreManager:
             self.store_path,
             self.embeddings,
             allow_dangerous_deserialization=True,
+            normalize_L2=True,
         )
         return self.vector_store
 
@@ -89,6 +201,74 @@ class VectorStoreManager:
             return self.load_index()
         return self.create_index(documents)
 
+    def embedding_matrix(self) -> Optional[np.ndarray]:
+        """Return a zero-copy ``(N, d)`` float32 view of the indexed vectors.
+
+        The view aliases the FAISS storage of flat and HNSW-flat indexes,
+        whether they were created or loaded, and is rebuilt on every call so
+        it always reflects the vectors currently in the index. Quantized
+        (``HNSW32,SQ8``) and IVF indexes hold no float vectors and return
+        ``None``, as does a manager without a store. The view is only valid
+        until vectors are next added to the store.
+        """
+
+        if self.vector_store is None:
+            return None
+        index = faiss.downcast_index(self.vector_store.index)
+        if isinstance(index, faiss.IndexHNSWFlat):
+            index = faiss.downcast_index(index.storage)
+        if not isinstance(index, faiss.IndexFlat) or index.ntotal == 0:
+            return None
+        return faiss.rev_swig_ptr(index.get_xb(), index.ntotal * index.d).reshape(
+            index.ntotal, index.d
+        )
+
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed ``texts`` into one L2-normalized float32 matrix.
+
+        By default all texts go to the embedding model in a single
+        ``embed_documents`` call, leaving request batching to the model
+        (``OpenAIEmbeddings.chunk_size``, the sentence-transformers
+        ``batch_size``). When ``embed_batch_size`` is set, texts are sent in
+        slices of that size and written into one preallocated matrix.
+        """
+
+        batch_size = self.embed_batch_size or len(texts)
+        vectors: Optional[np.ndarray] = None
+        for start in range(0, len(texts), batch_size):
+            batch = np.asarray(
+                self.embeddings.embed_documents(texts[start : start + batch_size]),
+                dtype=np.float32,
+            )
+            if vectors is None:
+                vectors = np.empty((len(texts), batch.shape[1]), dtype=np.float32)
+            vectors[start : start + len(batch)] = batch
+
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    def _build_faiss_index(self, vectors: np.ndarray) -> faiss.Index:
+        """Build an empty, trained FAISS index sized for ``vectors``.
+
+        Corpora above ``IVFPQ_MIN_DOCUMENTS`` use the IVF/PQ FastScan factory
+        when the embedding dimension is divisible by the PQ sub-quantizer
+        count; everything else uses HNSW. With ``int8_quantize`` the HNSW
+        graph stores 8-bit codes whose per-dimension ranges are trained on
+        ``vectors`` and persisted inside the index file.
+        """
+
+        count, dim = vectors.shape
+        if count > self.IVFPQ_MIN_DOCUMENTS and dim % self.IVFPQ_SUBQUANTIZERS == 0:
+            index = faiss.index_factory(dim, self.IVFPQ_INDEX_FACTORY)
+            index.train(vectors)
+            faiss.extract_index_ivf(index).nprobe = self.IVFPQ_NPROBE
+            return index
+        if self.int8_quantize:
+            index = faiss.index_factory(dim, self.HNSW_INT8_INDEX_FACTORY)
+            index.train(vectors)
+            return index
+        return faiss.index_factory(dim, self.HNSW_INDEX_FACTORY)
+
     def _write_integrity_manifest(self) -> None:
         """Persist simple integrity hashes for stored FAISS files."""
 
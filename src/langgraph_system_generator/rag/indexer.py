@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Literal, Optional
 
 import aiohttp
 from bs4 import BeautifulSoup
@@ -13,7 +13,13 @@ from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from langgraph_system_generator.utils.config import get_settings
-from langgraph_system_generator.rag.embeddings import VectorStoreManager
+from langgraph_system_generator.rag.embeddings import (
+    EmbeddingBackend,
+    VectorStoreManager,
+    create_local_embeddings,
+)
+
+ChunkUnit = Literal["characters", "tokens"]
 
 
 class DocsIndexer:
@@ -195,11 +201,21 @@ class DocsIndexer:
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
         request_timeout: float = 30.0,
+        max_concurrency: int = 16,
+        chunk_unit: ChunkUnit = "characters",
+        token_encoding: str = "cl100k_base",
     ):
+        if max_concurrency <= 0:
+            raise ValueError(
+                f"max_concurrency ({max_concurrency}) must be a positive integer."
+            )
         self.urls = list(urls) if urls is not None else self.DOCS_URLS
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.request_timeout = request_timeout
+        self.max_concurrency = max_concurrency
+        self.chunk_unit = chunk_unit
+        self.token_encoding = token_encoding
 
     async def scrape_docs(self) -> List[Document]:
         """Scrape configured documentation pages and convert them to documents."""
@@ -207,9 +223,16 @@ class DocsIndexer:
         if not self.urls:
             return []
 
+        # Fetch concurrently, but cap in-flight requests per scrape.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_fetch(session: aiohttp.ClientSession, url: str) -> str:
+            async with semaphore:
+                return await self._fetch(session, url)
+
         async with aiohttp.ClientSession() as session:
             responses = await asyncio.gather(
-                *[self._fetch(session, url) for url in self.urls],
+                *[bounded_fetch(session, url) for url in self.urls],
                 return_exceptions=True,
             )
 
@@ -231,16 +254,59 @@ class DocsIndexer:
         return documents
 
     def chunk_documents(self, docs: List[Document]) -> List[Document]:
-        """Split documents into overlapping chunks."""
+        """Split documents into overlapping chunks.
+
+        ``chunk_size`` and ``chunk_overlap`` are measured in characters by
+        default, or in tiktoken tokens when ``chunk_unit`` is ``"tokens"``.
+        """
 
         if not docs:
             return []
 
+        if self.chunk_unit == "tokens":
+            return self._chunk_by_tokens(docs)
+
         splitter = RecursiveCharacterTextSplitter(
             chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap
         )
         return splitter.split_documents(docs)
 
+    def _chunk_by_tokens(self, docs: List[Document]) -> List[Document]:
+        """Split documents into fixed token windows using tiktoken.
+
+        All documents are encoded in one batch call, then sliced with a stride
+        of ``chunk_size - chunk_overlap`` tokens and decoded per chunk.
+        """
+
+        try:
+            import tiktoken
+        except ImportError as exc:
+            raise ImportError(
+                "tiktoken is required for token-based chunking. "
+                "Install it with: pip install tiktoken"
+            ) from exc
+
+        stride = self.chunk_size - self.chunk_overlap
+        if stride <= 0:
+            raise ValueError(
+                f"chunk_overlap ({self.chunk_overlap}) must be smaller than "
+                f"chunk_size ({self.chunk_size})."
+            )
+
+        encoding = tiktoken.get_encoding(self.token_encoding)
+        token_lists = encoding.encode_ordinary_batch([doc.page_content for doc in docs])
+
+        chunks: List[Document] = []
+        for doc, tokens in zip(docs, token_lists):
+            for start in range(0, len(tokens), stride):
+                window = tokens[start : start + self.chunk_size]
+                chunks.append(
+                    Document(page_content=encoding.decode(window), metadata=dict(doc.metadata))
+                )
+                if start + self.chunk_size >= len(tokens):
+                    break
+        return chunks
+
     async def _fetch(self, session: aiohttp.ClientSession, url: str) -> str:
         async with session.get(url, timeout=self.request_timeout) as response:
             response.raise_for_status()
@@ -297,6 +363,9 @@ async def build_docs_index(
     chunk_size: int = 1000,
     chunk_overlap: int = 200,
     embeddings: Optional[Embeddings] = None,
+    embedding_backend: Optional[EmbeddingBackend] = None,
+    chunk_unit: ChunkUnit = "characters",
+    token_encoding: str = "cl100k_base",
 ) -> VectorStoreManager:
     """Build (or load) the LangGraph documentation vector index.
 
@@ -318,11 +387,20 @@ async def build_docs_index(
     force_rebuild
         When True, recreate the index even if one already exists.
     chunk_size
-        Maximum characters per chunk when splitting documents.
+        Maximum characters (or tokens, see ``chunk_unit``) per chunk.
     chunk_overlap
-        Overlap size (in characters) between adjacent chunks.
+        Overlap size between adjacent chunks, in the same unit.
     embeddings
         Optional LangChain-compatible embeddings implementation to use.
+    embedding_backend
+        When set and ``embeddings`` is not provided, embed with a local
+        sentence-transformers model running on this backend (``"torch"``,
+        ``"onnx"`` or ``"openvino"``) instead of OpenAI.
+    chunk_unit
+        ``"characters"`` (default) or ``"tokens"`` to chunk by tiktoken
+        token windows.
+    token_encoding
+        tiktoken encoding used when ``chunk_unit`` is ``"tokens"``.
 
     Returns
     -------
@@ -331,12 +409,16 @@ async def build_docs_index(
     """
 
     settings = get_settings()
+    if embeddings is None and embedding_backend is not None:
+        embeddings = create_local_embeddings(backend=embedding_backend)
     destination = store_path or settings.vector_store_path
 
     indexer = DocsIndexer(
         urls=urls,
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
+        chunk_unit=chunk_unit,
+        token_encoding=token_encoding,
     )
 
     if documents is None:
@@ -359,6 +441,9 @@ async def build_index_from_cache(
     embeddings: Optional[Embeddings] = None,
     chunk_size: int = 1000,
     chunk_overlap: int = 200,
+    embedding_backend: Optional[EmbeddingBackend] = None,
+    chunk_unit: ChunkUnit = "characters",
+    token_encoding: str = "cl100k_base",
 ) -> VectorStoreManager:
     """Build vector index from cached documents.
     
@@ -375,9 +460,17 @@ async def build_index_from_cache(
     embeddings
         Optional LangChain-compatible embeddings implementation to use.
     chunk_size
-        Maximum characters per chunk when splitting documents.
+        Maximum characters (or tokens, see ``chunk_unit``) per chunk.
     chunk_overlap
-        Overlap size (in characters) between adjacent chunks.
+        Overlap size between adjacent chunks, in the same unit.
+    embedding_backend
+        When set and ``embeddings`` is not provided, embed with a local
+        sentence-transformers model running on this backend.
+    chunk_unit
+        ``"characters"`` (default) or ``"tokens"`` to chunk by tiktoken
+        token windows.
+    token_encoding
+        tiktoken encoding used when ``chunk_unit`` is ``"tokens"``.
         
     Returns
     -------
@@ -387,6 +480,8 @@ async def build_index_from_cache(
     from langgraph_system_generator.rag.cache import DocumentCache
     
     settings = get_settings()
+    if embeddings is None and embedding_backend is not None:
+        embeddings = create_local_embeddings(backend=embedding_backend)
     destination = store_path or settings.vector_store_path
     
     # Load documents from cache
@@ -397,7 +492,12 @@ async def build_index_from_cache(
     documents = cache.load_documents()
     
     # Chunk documents
-    indexer = DocsIndexer(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    indexer = DocsIndexer(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        chunk_unit=chunk_unit,
+        token_encoding=token_encoding,
+    )
     chunks = indexer.chunk_documents(documents)
     
     # Create index
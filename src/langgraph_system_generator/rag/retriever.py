@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, TypedDict
+from typing import List, Optional, Tuple, TypedDict
+
+import numpy as np
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
 
 from langgraph_system_generator.rag.embeddings import VectorStoreManager
 
+try:
+    import simsimd
+except ImportError:  # Optional SIMD accelerator; FAISS search is the fallback.
+    simsimd = None
+
 
 class RetrievedSnippet(TypedDict):
     content: str
@@ -33,7 +42,9 @@ class DocsRetriever:
         if store is None:
             return []
 
-        docs_with_scores = store.similarity_search_with_score(query, k=k)
+        docs_with_scores = self._simsimd_search(store, query, k)
+        if docs_with_scores is None:
+            docs_with_scores = store.similarity_search_with_score(query, k=k)
 
         results: List[RetrievedSnippet] = []
         for doc, score in docs_with_scores:
@@ -47,6 +58,42 @@ class DocsRetriever:
             )
         return results
 
+    def _simsimd_search(
+        self, store: FAISS, query: str, k: int
+    ) -> Optional[List[Tuple[Document, float]]]:
+        """Score the query against all stored vectors with SimSIMD.
+
+        Scores are squared L2 distances, matching FAISS's ``METRIC_L2`` output.
+        Returns ``None`` when SimSIMD is unavailable, the index holds no
+        uncompressed vectors (quantized or IVF stores), or the vectors no longer
+        line up with ``store``, so the caller falls back to the FAISS index.
+        """
+
+        if simsimd is None:
+            return None
+        matrix = self.vector_store_manager.embedding_matrix()
+        if matrix is None or not len(matrix) or len(matrix) != store.index.ntotal:
+            return None
+
+        query_vector = np.asarray(
+            self.vector_store_manager.embeddings.embed_query(query), dtype=np.float32
+        )
+        # Stored vectors are L2-normalized, as FAISS does for queries.
+        query_vector /= np.linalg.norm(query_vector) or 1.0
+        scores = np.asarray(
+            simsimd.cdist(query_vector[None, :], matrix, metric="sqeuclidean")
+        )[0]
+
+        k = min(k, len(scores))
+        top = np.argpartition(scores, k - 1)[:k]
+        top = top[np.argsort(scores[top])]
+
+        results: List[Tuple[Document, float]] = []
+        for position in top:
+            doc_id = store.index_to_docstore_id[int(position)]
+            results.append((store.docstore.search(doc_id), float(scores[position])))
+        return results
+
     def retrieve_for_pattern(self, pattern_name: str) -> List[RetrievedSnippet]:
         """Retrieve docs specific to a pattern (router, subagents, etc)."""
 
@@ -76,6 +76,10 @@ class Settings(BaseSettings):
         default="./data/vector_store",
         description="Filesystem path for storing vector index data.",
     )
+    vector_store_int8: bool = Field(
+        default=True,
+        description="Store vectors as 8-bit scalar-quantized codes in the FAISS index.",
+    )
 
     default_model: str = Field(
         default="gpt-5-mini",
@@ -0,0 +1,47 @@
+"""Shared fixtures for unit tests of the static web UI files."""
+
+import os
+from pathlib import Path
+from typing import Set
+
+import pytest
+from bs4 import BeautifulSoup
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+@pytest.fixture(scope="session")
+def static_dir() -> Path:
+    """Directory holding the web UI's static assets."""
+    return REPO_ROOT / "src/langgraph_system_generator/api/static"
+
+
+@pytest.fixture(scope="session")
+def static_files(static_dir: Path) -> Set[str]:
+    """Names in the static directory, listed once per session."""
+    return set(os.listdir(static_dir)) if static_dir.is_dir() else set()
+
+
+@pytest.fixture(scope="session")
+def html_content(static_dir: Path) -> str:
+    """Raw text of ``index.html``, read once per session."""
+    return (static_dir / "index.html").read_text()
+
+
+@pytest.fixture(scope="session")
+def html_soup(html_content: str) -> BeautifulSoup:
+    """Parsed ``index.html``; shared across tests, so treat it as read-only."""
+    return BeautifulSoup(html_content, "html.parser")
+
+
+@pytest.fixture(scope="session")
+def js_content(static_dir: Path) -> str:
+    """Raw text of ``app.js``, read once per session."""
+    return (static_dir / "app.js").read_text()
+
+
+@pytest.fixture(scope="session")
+def css_content(static_dir: Path) -> str:
+    """Raw text of ``style.css``, read once per session."""
+    return (static_dir / "style.css").read_text()
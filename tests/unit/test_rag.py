@@ -1,9 +1,19 @@
+import asyncio
+from typing import List
+
+import faiss
+import numpy as np
 import pytest
-from langchain_community.embeddings import FakeEmbeddings
+from langchain_community.embeddings import DeterministicFakeEmbedding, FakeEmbeddings
 from langchain_core.documents import Document
+from pydantic import Field
 
-from langgraph_system_generator.rag.embeddings import VectorStoreManager
+from langgraph_system_generator.rag.embeddings import (
+    VectorStoreManager,
+    create_local_embeddings,
+)
 from langgraph_system_generator.rag.indexer import DocsIndexer, build_docs_index
+from langgraph_system_generator.rag import retriever as retriever_module
 from langgraph_system_generator.rag.retriever import DocsRetriever
 
 
@@ -100,3 +110,294 @@ async def test_scrape_docs_handles_errors(monkeypatch):
     monkeypatch.setattr(indexer, "_fetch", _raise)
     docs = await indexer.scrape_docs()
     assert docs == []
+
+
+def test_vector_store_manager_selects_index_by_corpus_size(tmp_path):
+    manager = VectorStoreManager(
+        store_path=str(tmp_path), embeddings=FakeEmbeddings(size=32), int8_quantize=False
+    )
+    small = np.random.rand(10, 32).astype("float32")
+    assert isinstance(manager._build_faiss_index(small), faiss.IndexHNSWFlat)
+
+    manager.int8_quantize = True
+    quantized = manager._build_faiss_index(small)
+    assert isinstance(quantized, faiss.IndexHNSWSQ)
+    assert quantized.is_trained
+
+    manager.IVFPQ_MIN_DOCUMENTS = 300
+    large = np.random.rand(400, 32).astype("float32")
+    index = manager._build_faiss_index(large)
+    assert index.is_trained
+    assert faiss.extract_index_ivf(index).nprobe == manager.IVFPQ_NPROBE
+
+
+class NumpySimSIMD:
+    """Stand-in for ``simsimd`` that records calls and scores with numpy."""
+
+    calls = 0
+
+    @classmethod
+    def cdist(cls, queries, matrix, metric):
+        assert metric == "sqeuclidean"
+        cls.calls += 1
+        return ((queries[:, None, :] - matrix[None, :, :]) ** 2).sum(axis=-1)
+
+
+def _assert_matches_faiss(retriever, store, query, k):
+    calls = NumpySimSIMD.calls
+    results = retriever.retrieve(query, k=k)
+    expected = store.similarity_search_with_score(query, k=k)
+
+    assert NumpySimSIMD.calls == calls + 1
+    assert [r["source"] for r in results] == [
+        doc.metadata["source"] for doc, _ in expected
+    ]
+    assert [r["relevance_score"] for r in results] == pytest.approx(
+        [score for _, score in expected], rel=1e-4, abs=1e-5
+    )
+
+
+def test_retriever_simsimd_path_matches_faiss_search(tmp_path, monkeypatch):
+    monkeypatch.setattr(retriever_module, "simsimd", NumpySimSIMD)
+    embeddings = DeterministicFakeEmbedding(size=32)
+    docs = [
+        Document(page_content=f"LangGraph document {i}", metadata={"source": f"local://{i}"})
+        for i in range(8)
+    ]
+    manager = VectorStoreManager(
+        store_path=str(tmp_path), embeddings=embeddings, int8_quantize=False
+    )
+    store = manager.create_index(docs)
+    _assert_matches_faiss(DocsRetriever(manager), store, "LangGraph router", k=3)
+
+    loaded = VectorStoreManager(
+        store_path=str(tmp_path), embeddings=embeddings, int8_quantize=False
+    )
+    loaded_store = loaded.load_index()
+    _assert_matches_faiss(DocsRetriever(loaded), loaded_store, "LangGraph router", k=3)
+
+
+def test_retriever_simsimd_path_sees_vectors_added_after_build(tmp_path, monkeypatch):
+    monkeypatch.setattr(retriever_module, "simsimd", NumpySimSIMD)
+    embeddings = DeterministicFakeEmbedding(size=32)
+    docs = [
+        Document(page_content=f"LangGraph document {i}", metadata={"source": f"local://{i}"})
+        for i in range(8)
+    ]
+    manager = VectorStoreManager(
+        store_path=str(tmp_path), embeddings=embeddings, int8_quantize=False
+    )
+    store = manager.create_index(docs)
+    retriever = DocsRetriever(manager)
+    retriever.retrieve("LangGraph router", k=3)
+
+    store.add_texts(["LangGraph router"], metadatas=[{"source": "local://added"}])
+
+    assert len(manager.embedding_matrix()) == store.index.ntotal == 9
+    _assert_matches_faiss(retriever, store, "LangGraph router", k=3)
+    assert retriever.retrieve("LangGraph router", k=1)[0]["source"] == "local://added"
+
+
+@pytest.mark.asyncio
+async def test_scrape_docs_bounds_concurrency(monkeypatch):
+    indexer = DocsIndexer(
+        urls=[f"https://example.com/{i}" for i in range(6)], max_concurrency=2
+    )
+    in_flight = 0
+    peak = 0
+
+    async def _fetch(session, url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f"<html><body><h1>{url}</h1><p>{'content ' * 20}</p></body></html>"
+
+    monkeypatch.setattr(indexer, "_fetch", _fetch)
+    docs = await indexer.scrape_docs()
+
+    assert peak == 2
+    assert len(docs) == 6
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_docs_indexer_rejects_non_positive_concurrency(max_concurrency):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        DocsIndexer(urls=[], max_concurrency=max_concurrency)
+
+
+def test_load_index_restores_docstore(tmp_path):
+    docs = [
+        Document(page_content=f"LangGraph document {i}", metadata={"source": f"local://{i}"})
+        for i in range(4)
+    ]
+    VectorStoreManager(
+        store_path=str(tmp_path), embeddings=FakeEmbeddings(size=32)
+    ).create_index(docs)
+
+    manager = VectorStoreManager(
+        store_path=str(tmp_path), embeddings=FakeEmbeddings(size=32)
+    )
+    store = manager.load_index()
+
+    assert store.index.ntotal == len(docs)
+    assert store._normalize_L2
+    sources = {
+        store.docstore.search(doc_id).metadata["source"]
+        for doc_id in store.index_to_docstore_id.values()
+    }
+    assert sources == {f"local://{i}" for i in range(4)}
+
+
+def test_reloaded_ivf_store_retrieves_through_faiss(tmp_path, monkeypatch):
+    docs = [
+        Document(page_content=f"LangGraph document {i}", metadata={"source": f"local://{i}"})
+        for i in range(400)
+    ]
+    builder = VectorStoreManager(
+        store_path=str(tmp_path), embeddings=FakeEmbeddings(size=32), int8_quantize=False
+    )
+    builder.IVFPQ_MIN_DOCUMENTS = 300
+    builder.create_index(docs)
+    assert builder.embedding_matrix() is None
+
+    manager = VectorStoreManager(
+        store_path=str(tmp_path), embeddings=FakeEmbeddings(size=32)
+    )
+    store = manager.load_index()
+    assert isinstance(faiss.downcast_index(store.index), faiss.IndexIVFPQFastScan)
+    assert manager.embedding_matrix() is None
+
+    class UnusedSimSIMD:
+        @staticmethod
+        def cdist(*args, **kwargs):
+            raise AssertionError("IVF stores must be searched through FAISS")
+
+    monkeypatch.setattr(retriever_module, "simsimd", UnusedSimSIMD)
+    results = DocsRetriever(manager).retrieve("LangGraph router", k=3)
+
+    assert len(results) == 3
+    assert all(r["source"].startswith("local://") for r in results)
+
+
+def test_token_chunking_windows_and_preserves_metadata():
+    tiktoken = pytest.importorskip("tiktoken")
+    try:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        pytest.skip("cl100k_base encoding is not available offline")
+
+    base_doc = Document(
+        page_content=" ".join(f"word{i}" for i in range(60)),
+        metadata={"source": "https://example.com/doc"},
+    )
+    indexer = DocsIndexer(chunk_size=20, chunk_overlap=5, chunk_unit="tokens")
+
+    chunks = indexer.chunk_documents([base_doc])
+
+    assert len(chunks) >= 2
+    first = encoding.encode_ordinary(chunks[0].page_content)
+    second = encoding.encode_ordinary(chunks[1].page_content)
+    assert len(first) == 20
+    assert first[-5:] == second[:5]
+    assert all(c.metadata["source"] == "https://example.com/doc" for c in chunks)
+    assert chunks[0].metadata is not base_doc.metadata
+
+
+@pytest.mark.asyncio
+async def test_build_docs_index_chunks_by_tokens(tmp_path, monkeypatch):
+    tiktoken = pytest.importorskip("tiktoken")
+    # Byte-level encoding built locally, so the test needs no downloaded BPE.
+    byte_encoding = tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+    requested = []
+
+    def get_encoding(name):
+        requested.append(name)
+        return byte_encoding
+
+    monkeypatch.setattr(tiktoken, "get_encoding", get_encoding)
+    doc = Document(page_content="x" * 50, metadata={"source": "local://doc"})
+
+    manager = await build_docs_index(
+        documents=[doc],
+        store_path=str(tmp_path),
+        chunk_size=20,
+        chunk_overlap=5,
+        embeddings=FakeEmbeddings(size=32),
+        chunk_unit="tokens",
+        token_encoding="test-encoding",
+    )
+
+    store = manager.vector_store
+    contents = [
+        store.docstore.search(doc_id).page_content
+        for doc_id in store.index_to_docstore_id.values()
+    ]
+    assert requested == ["test-encoding"]
+    assert sorted(len(c) for c in contents) == [20, 20, 20]
+
+
+class RecordingEmbeddings(FakeEmbeddings):
+    """FakeEmbeddings that records the size of each embed_documents call."""
+
+    batch_sizes: List[int] = Field(default_factory=list)
+
+    def embed_documents(self, texts):
+        self.batch_sizes.append(len(texts))
+        return super().embed_documents(texts)
+
+
+@pytest.mark.parametrize("embed_batch_size", [0, -1])
+def test_vector_store_manager_rejects_non_positive_batch_size(tmp_path, embed_batch_size):
+    with pytest.raises(ValueError, match="embed_batch_size"):
+        VectorStoreManager(
+            store_path=str(tmp_path),
+            embeddings=FakeEmbeddings(size=32),
+            embed_batch_size=embed_batch_size,
+        )
+
+
+def test_create_index_embeds_in_batches(tmp_path):
+    embeddings = RecordingEmbeddings(size=32)
+    manager = VectorStoreManager(
+        store_path=str(tmp_path),
+        embeddings=embeddings,
+        int8_quantize=False,
+        embed_batch_size=3,
+    )
+    docs = [Document(page_content=f"doc {i}") for i in range(8)]
+
+    manager.create_index(docs)
+
+    assert embeddings.batch_sizes == [3, 3, 2]
+    matrix = manager.embedding_matrix()
+    assert matrix.shape == (8, 32)
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0, atol=1e-5)
+
+
+def test_create_index_embeds_in_one_call_by_default(tmp_path):
+    embeddings = RecordingEmbeddings(size=32)
+    manager = VectorStoreManager(store_path=str(tmp_path), embeddings=embeddings)
+
+    manager.create_index([Document(page_content=f"doc {i}") for i in range(100)])
+
+    assert embeddings.batch_sizes == [100]
+
+
+def test_create_local_embeddings_reports_missing_extra():
+    try:
+        import sentence_transformers  # noqa: F401
+        import langchain_huggingface  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip("local-embeddings extra is installed")
+
+    with pytest.raises(ImportError, match="local-embeddings"):
+        create_local_embeddings()
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import nbformat
 import pytest
+from nbformat import v3
 from nbformat.v4 import new_code_cell, new_notebook
 
 from langgraph_system_generator.generator.state import QAReport
@@ -417,3 +418,55 @@ def test_integration_repair_cycle(tmp_notebook_path: Path, repair_agent):
     summary = repair_agent.get_repair_summary(repaired_reports)
     assert summary["total_checks"] > 0
     assert summary["passed"] > 0
+
+
+def test_repair_preserves_valid_notebook_format(tmp_notebook_path: Path, repair_agent):
+    """Test repaired notebooks stay schema-valid with joined cell sources."""
+    nb = new_notebook()
+    nb.cells.append(new_code_cell(source="import os\n# TODO: implement\nx = 1"))
+
+    with tmp_notebook_path.open("w") as f:
+        nbformat.write(nb, f)
+
+    qa_reports = [
+        QAReport(
+            check_name="No Placeholders",
+            passed=False,
+            message="Found placeholders: TODO (1x)",
+            suggestions=["Remove placeholders"],
+        )
+    ]
+
+    repair_agent.repair_notebook(tmp_notebook_path, qa_reports)
+
+    with tmp_notebook_path.open("r") as f:
+        repaired_nb = nbformat.read(f, as_version=4)
+
+    nbformat.validate(repaired_nb)
+    assert repaired_nb.cells[0].source.startswith("import os\n")
+
+
+def test_repair_upgrades_v3_notebook(tmp_notebook_path: Path, repair_agent):
+    """Test repairing a v3 notebook whose sources are stored as line lists."""
+    nb = v3.new_notebook()
+    cell = v3.new_code_cell(input="import os\n# TODO: implement\nx = 1")
+    nb.worksheets.append(v3.new_worksheet(cells=[cell]))
+    tmp_notebook_path.write_text(nbformat.writes(nb, version=3))
+
+    qa_reports = [
+        QAReport(
+            check_name="No Placeholders",
+            passed=False,
+            message="Found placeholders: TODO (1x)",
+            suggestions=["Remove placeholders"],
+        )
+    ]
+
+    repair_agent.repair_notebook(tmp_notebook_path, qa_reports)
+
+    with tmp_notebook_path.open("r") as f:
+        repaired_nb = nbformat.read(f, as_version=4)
+
+    assert repaired_nb.nbformat == 4
+    assert "TODO" not in repaired_nb.cells[0].source
+    assert repaired_nb.cells[0].source.startswith("import os\n")
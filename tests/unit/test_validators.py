@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 import nbformat
+import orjson
 import pytest
 from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
 
 from langgraph_system_generator.qa.validators import NotebookValidator
 
 
+def _write_nb(nb: nbformat.NotebookNode, path: Path) -> None:
+    """Serialize a test notebook in one write, skipping nbformat's validation."""
+    path.write_bytes(orjson.dumps(nb))
+
+
 @pytest.fixture
 def tmp_notebook_path(tmp_path: Path) -> Path:
     """Create a temporary notebook path."""
     return tmp_path / "test_notebook.ipynb"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_notebook() -> nbformat.NotebookNode:
     """Create a valid notebook for testing."""
     nb = new_notebook()
@@ -70,19 +77,54 @@ compiled_graph = graph.compile()""",
     return nb
 
 
-def test_validate_json_structure_valid(tmp_notebook_path: Path, valid_notebook):
-    """Test JSON validation with a valid notebook."""
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(valid_notebook, f)
+@pytest.fixture(scope="session")
+def valid_notebook_bytes(valid_notebook: nbformat.NotebookNode) -> bytes:
+    """Serialize the shared valid notebook once for the whole session."""
+    return orjson.dumps(valid_notebook)
+
+
+@pytest.fixture(scope="module")
+def valid_notebook_file(
+    tmp_path_factory: pytest.TempPathFactory, valid_notebook_bytes: bytes
+) -> Path:
+    """Write the shared valid notebook once for the module's read-only checks."""
+    path = tmp_path_factory.mktemp("valid") / "valid_notebook.ipynb"
+    path.write_bytes(valid_notebook_bytes)
+    return path
+
 
+def test_validate_json_structure_valid(valid_notebook_file: Path):
+    """Test JSON validation with a valid notebook."""
     validator = NotebookValidator()
-    report = validator.validate_json_structure(tmp_notebook_path)
+    report = validator.validate_json_structure(valid_notebook_file)
 
     assert report.passed
     assert report.check_name == "JSON Validity"
     assert "valid" in report.message.lower()
 
 
+def test_validate_json_structure_from_stream(valid_notebook_bytes: bytes):
+    """Test JSON validation reading from an open binary stream."""
+    validator = NotebookValidator()
+    report = validator.validate_json_structure(io.BytesIO(valid_notebook_bytes))
+
+    assert report.passed
+    assert report.check_name == "JSON Validity"
+
+
+def test_validate_json_structure_invalid_node():
+    """Test JSON validation of an already-parsed notebook with a bad structure."""
+    nb = new_notebook()
+    nb.cells.append(new_code_cell(source="x = 1"))
+    del nb.cells[0]["outputs"]
+
+    validator = NotebookValidator()
+    report = validator.validate_json_structure(nb)
+
+    assert not report.passed
+    assert "structure" in report.message.lower()
+
+
 def test_validate_json_structure_missing_file(tmp_path: Path):
     """Test JSON validation with missing file."""
     validator = NotebookValidator()
@@ -95,8 +137,7 @@ def test_validate_json_structure_missing_file(tmp_path: Path):
 
 def test_validate_json_structure_invalid_json(tmp_notebook_path: Path):
     """Test JSON validation with invalid JSON."""
-    with tmp_notebook_path.open("w") as f:
-        f.write("{ invalid json }")
+    tmp_notebook_path.write_text("{ invalid json }")
 
     validator = NotebookValidator()
     report = validator.validate_json_structure(tmp_notebook_path)
@@ -106,217 +147,152 @@ def test_validate_json_structure_invalid_json(tmp_notebook_path: Path):
     assert "json" in report.message.lower()
 
 
-def test_check_no_placeholders_clean(tmp_notebook_path: Path, valid_notebook):
+def test_check_no_placeholders_clean(valid_notebook_file: Path):
     """Test placeholder check with clean notebook."""
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(valid_notebook, f)
-
     validator = NotebookValidator()
-    report = validator.check_no_placeholders(tmp_notebook_path)
+    report = validator.check_no_placeholders(valid_notebook_file)
 
     assert report.passed
     assert report.check_name == "No Placeholders"
 
 
-def test_check_no_placeholders_with_todo(tmp_notebook_path: Path):
-    """Test placeholder check with TODO."""
+@pytest.mark.parametrize(
+    ("source", "expected_placeholders"),
+    [
+        pytest.param("# TODO: implement this\npass", ["TODO"], id="todo"),
+        pytest.param(
+            "# TODO: fix this\n# FIXME: broken\npass", ["TODO", "FIXME"], id="multiple"
+        ),
+        pytest.param("def run():\n    ...", ["..."], id="ellipsis"),
+    ],
+)
+def test_check_no_placeholders_found(source: str, expected_placeholders: list[str]):
+    """Test placeholder check reports every placeholder present."""
     nb = new_notebook()
-    nb.cells.append(new_code_cell(source="# TODO: implement this\npass"))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
+    nb.cells.append(new_code_cell(source=source))
 
     validator = NotebookValidator()
-    report = validator.check_no_placeholders(tmp_notebook_path)
+    report = validator.check_no_placeholders(nb)
 
     assert not report.passed
-    assert "TODO" in report.message
+    for placeholder in expected_placeholders:
+        assert placeholder in report.message
     assert len(report.suggestions) > 0
 
 
-def test_check_no_placeholders_with_multiple(tmp_notebook_path: Path):
-    """Test placeholder check with multiple placeholders."""
-    nb = new_notebook()
-    nb.cells.append(new_code_cell(source="# TODO: fix this\n# FIXME: broken\npass"))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
-
-    validator = NotebookValidator()
-    report = validator.check_no_placeholders(tmp_notebook_path)
-
-    assert not report.passed
-    assert "TODO" in report.message
-    assert "FIXME" in report.message
-
-
-def test_check_required_sections_all_present(tmp_notebook_path: Path, valid_notebook):
+def test_check_required_sections_all_present(valid_notebook_file: Path):
     """Test section check with all required sections."""
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(valid_notebook, f)
-
     validator = NotebookValidator()
-    report = validator.check_required_sections(tmp_notebook_path)
+    report = validator.check_required_sections(valid_notebook_file)
 
     assert report.passed
     assert report.check_name == "Required Sections"
 
 
-def test_check_required_sections_missing(tmp_notebook_path: Path):
-    """Test section check with missing sections."""
-    nb = new_notebook()
-    nb.cells.append(new_code_cell(source="x = 1", metadata={"section": "setup"}))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
-
-    validator = NotebookValidator()
-    report = validator.check_required_sections(tmp_notebook_path)
-
-    assert not report.passed
-    assert "missing" in report.message.lower()
-    assert len(report.suggestions) > 0
-
-
-def test_check_required_sections_custom(tmp_notebook_path: Path):
-    """Test section check with custom required sections."""
+@pytest.mark.parametrize(
+    ("section", "required_sections", "expected_passed"),
+    [
+        pytest.param("setup", None, False, id="missing"),
+        pytest.param("custom", ["custom"], True, id="custom"),
+    ],
+)
+def test_check_required_sections(
+    section: str, required_sections: list[str] | None, expected_passed: bool
+):
+    """Test section check against default and custom required sections."""
     nb = new_notebook()
-    nb.cells.append(new_code_cell(source="x = 1", metadata={"section": "custom"}))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
+    nb.cells.append(new_code_cell(source="x = 1", metadata={"section": section}))
 
     validator = NotebookValidator()
-    report = validator.check_required_sections(tmp_notebook_path, ["custom"])
+    report = validator.check_required_sections(nb, required_sections)
 
-    assert report.passed
+    assert report.passed is expected_passed
+    if not expected_passed:
+        assert "missing" in report.message.lower()
+        assert len(report.suggestions) > 0
 
 
-def test_check_imports_present_all_present(tmp_notebook_path: Path, valid_notebook):
+def test_check_imports_present_all_present(valid_notebook_file: Path):
     """Test import check with all required imports."""
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(valid_notebook, f)
-
     validator = NotebookValidator()
-    report = validator.check_imports_present(tmp_notebook_path)
+    report = validator.check_imports_present(valid_notebook_file)
 
     assert report.passed
     assert report.check_name == "Required Imports"
 
 
-def test_check_imports_present_missing(tmp_notebook_path: Path):
-    """Test import check with missing imports."""
-    nb = new_notebook()
-    nb.cells.append(new_code_cell(source="x = 1"))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
-
-    validator = NotebookValidator()
-    report = validator.check_imports_present(tmp_notebook_path)
-
-    assert not report.passed
-    assert "missing" in report.message.lower()
-    assert len(report.suggestions) > 0
-
-
-def test_check_imports_present_custom(tmp_notebook_path: Path):
-    """Test import check with custom required imports."""
+@pytest.mark.parametrize(
+    ("source", "required_imports", "expected_passed"),
+    [
+        pytest.param("x = 1", None, False, id="missing"),
+        pytest.param("import custom_module", ["custom_module"], True, id="custom"),
+    ],
+)
+def test_check_imports_present(
+    source: str, required_imports: list[str] | None, expected_passed: bool
+):
+    """Test import check against default and custom required imports."""
     nb = new_notebook()
-    nb.cells.append(new_code_cell(source="import custom_module"))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
+    nb.cells.append(new_code_cell(source=source))
 
     validator = NotebookValidator()
-    report = validator.check_imports_present(tmp_notebook_path, ["custom_module"])
+    report = validator.check_imports_present(nb, required_imports)
 
-    assert report.passed
+    assert report.passed is expected_passed
+    if not expected_passed:
+        assert "missing" in report.message.lower()
+        assert len(report.suggestions) > 0
 
 
-def test_check_graph_compiles_valid(tmp_notebook_path: Path, valid_notebook):
+def test_check_graph_compiles_valid(valid_notebook_file: Path):
     """Test graph compilation check with valid code."""
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(valid_notebook, f)
-
     validator = NotebookValidator()
-    report = validator.check_graph_compiles(tmp_notebook_path)
+    report = validator.check_graph_compiles(valid_notebook_file)
 
     assert report.passed
     assert report.check_name == "Graph Compilation"
 
 
-def test_check_graph_compiles_syntax_error(tmp_notebook_path: Path):
-    """Test graph compilation check with syntax error."""
+@pytest.mark.parametrize(
+    ("cell", "expected_message"),
+    [
+        pytest.param(new_code_cell(source="def broken(\npass"), "syntax", id="syntax"),
+        pytest.param(
+            new_code_cell(source="x = 1\nprint(x)"), "StateGraph", id="no-graph"
+        ),
+        pytest.param(
+            new_code_cell(
+                source=(
+                    "from langgraph.graph import StateGraph\n"
+                    "graph = StateGraph(dict)"
+                )
+            ),
+            "compile",
+            id="no-compile",
+        ),
+        pytest.param(
+            new_markdown_cell(source="# Just markdown"), "no code cells", id="no-code"
+        ),
+    ],
+)
+def test_check_graph_compiles_failures(
+    cell: nbformat.NotebookNode, expected_message: str
+):
+    """Test graph compilation check failure modes."""
     nb = new_notebook()
-    nb.cells.append(new_code_cell(source="def broken(\npass"))  # Invalid syntax
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
+    nb.cells.append(cell)
 
     validator = NotebookValidator()
-    report = validator.check_graph_compiles(tmp_notebook_path)
+    report = validator.check_graph_compiles(nb)
 
     assert not report.passed
-    assert "syntax" in report.message.lower()
-
+    assert expected_message.lower() in report.message.lower()
 
-def test_check_graph_compiles_no_stategraph(tmp_notebook_path: Path):
-    """Test graph compilation check without StateGraph."""
-    nb = new_notebook()
-    nb.cells.append(new_code_cell(source="x = 1\nprint(x)"))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
-
-    validator = NotebookValidator()
-    report = validator.check_graph_compiles(tmp_notebook_path)
-
-    assert not report.passed
-    assert "StateGraph" in report.message
-
-
-def test_check_graph_compiles_no_compile_call(tmp_notebook_path: Path):
-    """Test graph compilation check without .compile() call."""
-    nb = new_notebook()
-    nb.cells.append(
-        new_code_cell(
-            source="from langgraph.graph import StateGraph\ngraph = StateGraph(dict)"
-        )
-    )
 
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
-
-    validator = NotebookValidator()
-    report = validator.check_graph_compiles(tmp_notebook_path)
-
-    assert not report.passed
-    assert "compile" in report.message.lower()
-
-
-def test_check_graph_compiles_no_code_cells(tmp_notebook_path: Path):
-    """Test graph compilation check with no code cells."""
-    nb = new_notebook()
-    nb.cells.append(new_markdown_cell(source="# Just markdown"))
-
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
-
-    validator = NotebookValidator()
-    report = validator.check_graph_compiles(tmp_notebook_path)
-
-    assert not report.passed
-    assert "no code cells" in report.message.lower()
-
-
-def test_validate_all_valid_notebook(tmp_notebook_path: Path, valid_notebook):
+def test_validate_all_valid_notebook(valid_notebook_file: Path):
     """Test validate_all with a valid notebook."""
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(valid_notebook, f)
-
     validator = NotebookValidator()
-    reports = validator.validate_all(tmp_notebook_path)
+    reports = validator.validate_all(valid_notebook_file)
 
     assert len(reports) == 5  # All validation checks
     assert all(r.passed for r in reports)
@@ -324,8 +300,7 @@ def test_validate_all_valid_notebook(tmp_notebook_path: Path, valid_notebook):
 
 def test_validate_all_invalid_json(tmp_notebook_path: Path):
     """Test validate_all with invalid JSON (should stop after first check)."""
-    with tmp_notebook_path.open("w") as f:
-        f.write("invalid json")
+    tmp_notebook_path.write_text("invalid json")
 
     validator = NotebookValidator()
     reports = validator.validate_all(tmp_notebook_path)
@@ -346,8 +321,7 @@ def test_validate_all_mixed_results(tmp_notebook_path: Path):
         )
     )
 
-    with tmp_notebook_path.open("w") as f:
-        nbformat.write(nb, f)
+    _write_nb(nb, tmp_notebook_path)
 
     validator = NotebookValidator()
     reports = validator.validate_all(tmp_notebook_path)
@@ -359,3 +333,19 @@ def test_validate_all_mixed_results(tmp_notebook_path: Path):
 
     assert len(passed) > 0  # JSON and imports should pass
     assert len(failed) > 0  # Placeholders and missing sections should fail
+
+
+def test_validate_all_no_code_cells():
+    """Test validate_all still reports every check for a markdown-only notebook."""
+    nb = new_notebook()
+    nb.cells.append(new_markdown_cell(source="## Setup", metadata={"section": "setup"}))
+
+    validator = NotebookValidator()
+    reports = {r.check_name: r for r in validator.validate_all(nb)}
+
+    assert len(reports) == 5
+    assert reports["JSON Validity"].passed
+    assert reports["No Placeholders"].passed
+    assert not reports["Required Imports"].passed
+    assert "langgraph, StateGraph, END" in reports["Required Imports"].message
+    assert "no code cells" in reports["Graph Compilation"].message.lower()